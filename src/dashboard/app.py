@@ -29,6 +29,9 @@ logger = logging.getLogger(__name__)
 class ServiceManager:
     """Manages all dashboard services"""
     
+    # Services already built per configuration, shared across sessions
+    _instances: Dict[tuple, Dict] = {}
+    
     def __init__(self, config: DashboardConfig):
         """Initialize service manager with configuration"""
         self.config = config
@@ -41,6 +44,15 @@ class ServiceManager:
         Returns:
             True if successful, False otherwise
         """
+        key = self._config_key(self.config)
+        cached = ServiceManager._instances.get(key)
+        if cached is not None:
+            logger.info("Reusing previously initialized services")
+            self.services = cached
+            for name, service in cached.items():
+                set_service(name, service)
+            return True
+        
         try:
             # Get user paths
             user_paths = self.config.get_user_paths()
@@ -62,8 +74,11 @@ class ServiceManager:
 
             # Extraction Service
             extraction_service = ExtractionService(
-               docker_image="rosbag-extractor"
+               docker_image="rosbag-extractor",
+               raw_root=service_config.raw_root,
+               processed_root=service_config.processed_root
            )
+            self.services['extraction_service'] = extraction_service
             set_service('extraction_service', extraction_service)
             
             # 2. Initialize Rosbag service (new)
@@ -94,9 +109,13 @@ class ServiceManager:
             set_service('download_service', download_service)
             
             # 5. Store service config for reference
+            self.services['service_config'] = service_config
             set_service('service_config', service_config)
+            self.services['user_paths'] = user_paths
             set_service('user_paths', user_paths)
             
+            ServiceManager._instances[key] = self.services
+            
             logger.info("All services initialized successfully")
             return True
             
@@ -107,6 +126,26 @@ class ServiceManager:
     def get_service(self, name: str):
         """Get a service by name"""
         return self.services.get(name)
+    
+    @classmethod
+    def invalidate(cls, config: Optional[DashboardConfig] = None):
+        """Forget initialized services for a configuration (all if None)"""
+        if config is None:
+            cls._instances.clear()
+        else:
+            cls._instances.pop(cls._config_key(config), None)
+    
+    @staticmethod
+    def _config_key(config: DashboardConfig) -> tuple:
+        """Key identifying the settings services are built from"""
+        return (
+            tuple(sorted(config.bucket_names.items())),
+            config.cache_path,
+            config.raw_data_path,
+            config.processed_data_path,
+            config.ml_data_path,
+            config.docker_image_name
+        )
 
 
 class DataOverviewDashboard:
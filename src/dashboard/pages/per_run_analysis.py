@@ -176,6 +176,8 @@ def render(gcs_service):
                             progress_bar.progress(1.0)
                             status_text.text(f"Extracted {job.frames_extracted} frames")
                         
+                        rosbag_service.invalidate_status(coord)
+                        
                         if job.status == ProcessingStatus.COMPLETE:
                             st.success("Extraction complete!")
                             st.rerun()
@@ -14,8 +14,9 @@ import rosbag
 from datetime import datetime
 
 class BagDataExtractor:
-    def __init__(self, timestamp_dir: str):
-        self.timestamp_dir = Path(f"/data/{timestamp_dir}")
+    def __init__(self, timestamp_dir: str, data_root: str = "/data", output_dir: str = "/output"):
+        self.timestamp_dir = Path(data_root) / timestamp_dir
+        self.output_dir = Path(output_dir)
         
         if not self.timestamp_dir.exists():
             raise ValueError(f"Timestamp directory not found: {self.timestamp_dir}")
@@ -32,7 +33,7 @@ class BagDataExtractor:
         self.detections = []
         self.tracking = []
         self.metadata = {
-            'timestamp': timestamp_dir,
+            'timestamp': Path(timestamp_dir).name,
             'extraction_time': datetime.now().isoformat(),
             'bags': []
         }
@@ -173,7 +174,7 @@ class BagDataExtractor:
         # Save frames CSV
         if self.frames:
             frames_df = pd.DataFrame(self.frames)
-            frames_df.to_csv("/output/frames.csv", index=False)
+            frames_df.to_csv(self.output_dir / "frames.csv", index=False)
             print(f"  - Saved {len(frames_df)} frame records to frames.csv")
         
         # Save detection summary CSV
@@ -188,11 +189,11 @@ class BagDataExtractor:
                     'image_timestamp_s': d['image_timestamp_s'],
                     'num_detections': d['num_detections']
                 })
-            pd.DataFrame(det_summary).to_csv("/output/detections.csv", index=False)
+            pd.DataFrame(det_summary).to_csv(self.output_dir / "detections.csv", index=False)
             print(f"  - Saved {len(det_summary)} detection records to detections.csv")
             
             # Save full detection data as JSON
-            with open("/output/detections_full.json", 'w') as f:
+            with open(self.output_dir / "detections_full.json", 'w') as f:
                 json.dump(self.detections, f, indent=2)
             print(f"  - Saved full detection data to detections_full.json")
         
@@ -208,16 +209,16 @@ class BagDataExtractor:
                     'image_timestamp_s': t['image_timestamp_s'],
                     'num_tracked': t['num_tracked']
                 })
-            pd.DataFrame(track_summary).to_csv("/output/tracking.csv", index=False)
+            pd.DataFrame(track_summary).to_csv(self.output_dir / "tracking.csv", index=False)
             print(f"  - Saved {len(track_summary)} tracking records to tracking.csv")
             
             # Save full tracking data as JSON
-            with open("/output/tracking_full.json", 'w') as f:
+            with open(self.output_dir / "tracking_full.json", 'w') as f:
                 json.dump(self.tracking, f, indent=2)
             print(f"  - Saved full tracking data to tracking_full.json")
         
         # Save metadata
-        with open("/output/metadata.yaml", 'w') as f:
+        with open(self.output_dir / "metadata.yaml", 'w') as f:
             yaml.dump(self.metadata, f, default_flow_style=False)
         print(f"  - Saved metadata.yaml")
 
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+ROS Bag Extraction Worker
+Long-running variant of extract_rosbag_data.py that processes jobs from stdin.
+
+Protocol: one JSON object per line on stdin, e.g.
+    {"src": "<run dir relative to /data>", "dst": "<output dir relative to /output>"}
+and one JSON reply per line on stdout:
+    {"ok": true, "output": "<extractor log>", "error": null}
+"""
+
+import io
+import sys
+import json
+from contextlib import redirect_stdout
+
+from extract_rosbag_data import BagDataExtractor
+
+# Amount of extractor log returned with each reply
+OUTPUT_TAIL_CHARS = 64 * 1024
+
+
+def run_job(job: dict) -> dict:
+    """Run a single extraction job and build the reply"""
+    log = io.StringIO()
+    try:
+        # Keep extractor prints off the protocol stream
+        with redirect_stdout(log):
+            extractor = BagDataExtractor(job['src'], output_dir=f"/output/{job['dst']}")
+            extractor.extract_all_bags()
+            extractor.save_results()
+        return {'ok': True, 'output': log.getvalue()[-OUTPUT_TAIL_CHARS:], 'error': None}
+    except Exception as e:
+        return {'ok': False, 'output': log.getvalue()[-OUTPUT_TAIL_CHARS:], 'error': str(e)}
+
+
+def main():
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            reply = run_job(json.loads(line))
+        except ValueError as e:
+            reply = {'ok': False, 'output': '', 'error': f"Invalid job: {e}"}
+
+        sys.stdout.write(json.dumps(reply) + "\n")
+        sys.stdout.flush()
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,18 @@
 Data models for the dashboard - defines core data structures
 """
 
+from __future__ import annotations
+
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 from pathlib import Path
 from enum import Enum
 from datetime import datetime
-import pandas as pd
-import plotly.graph_objects as go
+
+# Only needed for annotations; keeps importing the models cheap
+if TYPE_CHECKING:
+    import pandas as pd
+    import plotly.graph_objects as go
 
 class DataStatus(Enum):
     """Status of data availability for a run"""
@@ -32,11 +37,12 @@ class ProcessingStatus(Enum):
     CACHED = "cached"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RunCoordinate:
     """
     Identifies a specific run/timestamp in the hierarchy.
     Simplified version for dashboard use (not the full BagCoord from pipeline).
+    Immutable and hashable, so it can be used as a cache key.
     """
     cid: str
     regionid: str
@@ -44,7 +50,7 @@ class RunCoordinate:
     twid: str
     lbid: str
     timestamp: str
-    bag_indices: Optional[List[int]] = None
+    bag_indices: Optional[List[int]] = field(default=None, hash=False)
     
     def to_path_tuple(self) -> tuple:
         """Convert to tuple for path construction"""
@@ -211,7 +217,7 @@ class ExtractionJob:
     
     # Progress tracking  
     total_bags: int = 0
-    bags_processed: int = 0
+    bags_processed: Optional[int] = None  # None until read from metadata.yaml
     frames_extracted: int = 0
     detections_extracted: int = 0
     
@@ -3,16 +3,20 @@
 Download service - handles downloading rosbags from cloud storage
 """
 
+import os
+import time
 import logging
 import uuid
+from stat import S_ISREG
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 from models.data_models import (
     RunCoordinate, DownloadJob, ProcessingStatus
 )
 from services.gcs_service import GCSService
+from services.local_fs import NEGATIVE_CACHE_TTL_S, coord_path, map_status
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +38,9 @@ class DownloadService:
         self.gcs_service = gcs_service
         self.raw_root = Path(raw_root)
         self.active_jobs: Dict[str, DownloadJob] = {}
+        
+        # Coordinates recently found without a raw dir -> expiry (monotonic)
+        self._negative_cache: Dict[str, float] = {}
     
     def check_download_status(self, coord: RunCoordinate) -> Dict:
         """
@@ -46,8 +53,20 @@ class DownloadService:
             Status dictionary
         """
         raw_path = self._get_raw_path(coord)
+        key = coord.to_path_str()
+        
+        # Recently confirmed missing, skip the stat
+        expiry = self._negative_cache.get(key)
+        if expiry is not None and expiry > time.monotonic():
+            return {
+                'downloaded': False,
+                'path': None,
+                'bag_count': 0,
+                'total_size': 0
+            }
         
-        if not raw_path.exists():
+        if not os.path.isdir(raw_path):
+            self._negative_cache[key] = time.monotonic() + NEGATIVE_CACHE_TTL_S
             return {
                 'downloaded': False,
                 'path': None,
@@ -55,10 +74,9 @@ class DownloadService:
                 'total_size': 0
             }
         
-        # Count bag files
-        bags = list(raw_path.glob("rosbag_*.bag"))
+        bag_names, total_size = self._scan_bags(raw_path)
         
-        if not bags:
+        if not bag_names:
             return {
                 'downloaded': False,
                 'path': str(raw_path),
@@ -66,17 +84,30 @@ class DownloadService:
                 'total_size': 0
             }
         
-        # Calculate total size
-        total_size = sum(bag.stat().st_size for bag in bags)
-        
         return {
             'downloaded': True,
             'path': str(raw_path),
-            'bag_count': len(bags),
+            'bag_count': len(bag_names),
             'total_size': total_size,
-            'bags': [bag.name for bag in bags]
+            'bags': bag_names
         }
     
+    def invalidate_status(self, coord: RunCoordinate):
+        """Forget that a run's raw directory was missing"""
+        self._negative_cache.pop(coord.to_path_str(), None)
+    
+    def check_download_status_many(self, coords: List[RunCoordinate]) -> List[Dict]:
+        """
+        Check download status for many runs, overlapping filesystem latency
+        
+        Args:
+            coords: Run coordinates
+            
+        Returns:
+            Status dictionaries in the same order as coords
+        """
+        return map_status(self.check_download_status, coords)
+    
     def create_download_job(self, coord: RunCoordinate,
                           conflict_resolution: str = "skip") -> DownloadJob:
         """
@@ -179,6 +210,7 @@ class DownloadService:
             logger.error(f"Download failed: {e}")
         
         job.completed_at = datetime.now()
+        self.invalidate_status(job.coordinate)
         return job
     
     def get_job_status(self, job_id: str) -> Optional[DownloadJob]:
@@ -231,6 +263,32 @@ class DownloadService:
         
         return True  # Placeholder
     
+    def _scan_bags(self, raw_path: Path) -> Tuple[List[str], int]:
+        """
+        Collect bag names and their total size in a single directory pass
+        
+        Args:
+            raw_path: Raw data directory for a run
+            
+        Returns:
+            Tuple of (bag file names, total size in bytes)
+        """
+        bag_names = []
+        total_size = 0
+        with os.scandir(raw_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith("rosbag_") and name.endswith(".bag")):
+                    continue
+                
+                # One stat gives both the file type and the size
+                st = entry.stat()
+                if S_ISREG(st.st_mode):
+                    bag_names.append(name)
+                    total_size += st.st_size
+        
+        return bag_names, total_size
+    
     def _get_raw_path(self, coord: RunCoordinate) -> Path:
         """Get raw data path for coordinate"""
-        return self.raw_root / coord.to_path_str()
\ No newline at end of file
+        return coord_path(self.raw_root, coord.to_path_tuple())
\ No newline at end of file
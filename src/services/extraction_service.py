@@ -2,21 +2,67 @@
 Service for Docker-based rosbag extraction operations
 Handles Docker orchestration and container management
 """
+import os
+import json
+import mmap
+import asyncio
 import subprocess
+import tempfile
+import threading
 import logging
 import yaml
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Set
 from datetime import datetime
 import uuid
-import pandas as pd
 
 from models.data_models import (
     RunCoordinate, ExtractionJob, ProcessingStatus
 )
+from services.local_fs import YAML_LOADER
 
 logger = logging.getLogger(__name__)
 
+# Amount of container stdout kept on the job
+OUTPUT_TAIL_BYTES = 64 * 1024
+
+# Container name prefix of the long-lived extraction worker
+WORKER_CONTAINER_PREFIX = "rosbag-extractor-worker"
+
+# Default for how long a single job may run in the worker before it is treated as hung
+WORKER_REPLY_TIMEOUT_S = 60 * 60
+
+# Version label of the extraction image; bump with changes to the docker/ directory
+IMAGE_VERSION_LABEL = "rosbag-extractor.version"
+IMAGE_VERSION = "2"
+
+
+def _read_tail(f, limit: Optional[int] = OUTPUT_TAIL_BYTES) -> str:
+    """Read the last `limit` bytes of a binary file object (all if None)"""
+    size = f.seek(0, os.SEEK_END)
+    f.seek(max(0, size - limit) if limit is not None else 0)
+    return f.read().decode('utf-8', 'replace')
+
+
+def _count_csv_rows(path: Path) -> int:
+    """Count data rows of a CSV by scanning for newlines instead of parsing it"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            lines = 0
+            while True:
+                chunk = mm.read(1 << 20)
+                if not chunk:
+                    break
+                lines += chunk.count(b'\n')
+            # A last line without a trailing newline still counts
+            if mm[-1:] != b'\n':
+                lines += 1
+    # Minus the header row
+    return max(lines - 1, 0)
+
 
 class ExtractionService:
     """
@@ -24,37 +70,73 @@ class ExtractionService:
     Manages Docker images, containers, and extraction jobs.
     """
     
-    def __init__(self, docker_image: str = "rosbag-extractor", docker_dir: Optional[Path] = None):
+    # Images already confirmed to exist in this process
+    _image_checked: Set[str] = set()
+    
+    def __init__(self, docker_image: str = "rosbag-extractor", docker_dir: Optional[Path] = None,
+                 raw_root: Optional[Path] = None, processed_root: Optional[Path] = None,
+                 worker_timeout: Optional[float] = WORKER_REPLY_TIMEOUT_S):
         """
         Initialize extraction service
         
         Args:
             docker_image: Name of Docker image for extraction
             docker_dir: Directory containing Dockerfile and scripts
+            raw_root: Root directory for raw rosbag data; together with
+                processed_root enables the long-lived worker container
+            processed_root: Root directory for processed/extracted data
+            worker_timeout: Seconds a job may run in the worker before it is
+                failed as hung (None for no limit)
         """
         self.docker_image = docker_image
         self.docker_dir = docker_dir or Path(__file__).parent.parent / "docker"
+        self.raw_root = Path(raw_root).absolute() if raw_root else None
+        self.processed_root = Path(processed_root).absolute() if processed_root else None
+        
+        # Long-lived worker container, started on first use. The name is unique
+        # per instance so services never remove each other's worker.
+        self._worker: Optional[subprocess.Popen] = None
+        self._worker_name = f"{WORKER_CONTAINER_PREFIX}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._worker_lock = threading.Lock()
+        self._worker_reader = ThreadPoolExecutor(max_workers=1)
+        self._worker_disabled = self.raw_root is None or self.processed_root is None
+        self.worker_timeout = worker_timeout
+        
         self._ensure_docker_image()
     
     def _ensure_docker_image(self):
         """Ensure Docker image exists, build if necessary"""
+        if self.docker_image in ExtractionService._image_checked:
+            return
+        
         try:
-            # Check if image exists
+            # Check if image exists and was built from the current docker/ sources
             result = subprocess.run(
-                ["docker", "images", "-q", self.docker_image],
+                ["docker", "image", "inspect", "--format",
+                 f'{{{{ index .Config.Labels "{IMAGE_VERSION_LABEL}" }}}}', self.docker_image],
                 capture_output=True,
                 text=True,
                 check=False
             )
             
-            if not result.stdout.strip():
+            if result.returncode != 0:
                 logger.info(f"Docker image {self.docker_image} not found, building...")
                 self._build_docker_image()
+            elif result.stdout.strip() != IMAGE_VERSION:
+                logger.info(f"Docker image {self.docker_image} is outdated, rebuilding...")
+                self._build_docker_image()
             else:
                 logger.info(f"Docker image {self.docker_image} found")
+            
+            ExtractionService._image_checked.add(self.docker_image)
         except Exception as e:
             logger.error(f"Failed to check Docker image: {e}")
     
+    @classmethod
+    def reset_image_cache(cls):
+        """Forget which Docker images were already checked"""
+        cls._image_checked.clear()
+    
     def _build_docker_image(self):
         """Build the Docker image for extraction"""
         if not self.docker_dir.exists():
@@ -106,9 +188,11 @@ class ExtractionService:
         )
         
         # Count bags to process
-        if source_path.exists():
-            bags = list(source_path.glob("*.bag"))
-            job.total_bags = len(bags)
+        try:
+            with os.scandir(source_path) as entries:
+                job.total_bags = sum(1 for entry in entries if entry.name.endswith(".bag"))
+        except (FileNotFoundError, NotADirectoryError):
+            pass
         
         return job
     
@@ -126,73 +210,342 @@ class ExtractionService:
         job.started_at = datetime.now()
         
         try:
-            # Ensure output directory exists
-            job.output_path.mkdir(parents=True, exist_ok=True)
-          
-            # Build Docker command
-            docker_cmd = [
-                "docker", "run", "--rm",
-                "-v", f"{job.source_path.parent.absolute()}:/data:ro",
-                "--mount", f"type=bind,src={job.output_path.absolute()},dst=/output",
-                "-e", f"TIMESTAMP={job.coordinate.timestamp}",
-                self.docker_image
-            ]
-            
-            # Run extraction
-            logger.info(f"Running extraction for {job.coordinate.timestamp}")
-            logger.debug(f"Docker command: {' '.join(docker_cmd)}")
+            docker_cmd = self._prepare_extraction(job)
             
-            result = subprocess.run(
-                docker_cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            reply = self._run_in_worker(job)
+            if reply is not None:
+                returncode = 0 if reply.get('ok') else 1
+                self._finish_extraction(job, reply['cmd'], returncode,
+                                        reply.get('output') or '', reply.get('error') or '')
+                return job
             
-            job.docker_output = result.stdout
-            job.status = ProcessingStatus.COMPLETE
-            job.completed_at = datetime.now()
+            # Spool output to disk so verbose containers can't fill memory
+            with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+                result = subprocess.run(
+                    docker_cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=out,
+                    stderr=err,
+                    check=False
+                )
+                self._finish_extraction(job, docker_cmd, result.returncode,
+                                        _read_tail(out), _read_tail(err, limit=None))
             
-            # Count extracted items
-            self._update_extraction_stats(job)
+        except Exception as e:
+            self._fail_extraction(job, e)
+        
+        return job
+    
+    async def execute_extraction_async(self, job: ExtractionJob) -> ExtractionJob:
+        """
+        Execute extraction job using Docker without blocking the event loop
+        
+        Args:
+            job: Extraction job to execute
+            
+        Returns:
+            Updated job with results
+        """
+        job.status = ProcessingStatus.IN_PROGRESS
+        job.started_at = datetime.now()
+        
+        try:
+            docker_cmd = self._prepare_extraction(job)
             
-            logger.info(f"Extraction completed for {job.coordinate.timestamp}")
+            # The worker round-trip, stats and Parquet sidecars block, so run them off the loop
+            reply = await asyncio.to_thread(self._run_in_worker, job)
+            if reply is not None:
+                returncode = 0 if reply.get('ok') else 1
+                await asyncio.to_thread(self._finish_extraction, job, reply['cmd'], returncode,
+                                        reply.get('output') or '', reply.get('error') or '')
+                return job
             
-        except subprocess.CalledProcessError as e:
-            job.status = ProcessingStatus.FAILED
-            job.error_message = str(e)
-            job.docker_output = e.stderr if e.stderr else e.stdout
-            logger.error(f"Extraction failed: {e}")
+            with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+                proc = await asyncio.create_subprocess_exec(
+                    *docker_cmd,
+                    stdin=asyncio.subprocess.DEVNULL,
+                    stdout=out,
+                    stderr=err
+                )
+                returncode = await proc.wait()
+                await asyncio.to_thread(self._finish_extraction, job, docker_cmd, returncode,
+                                        _read_tail(out), _read_tail(err, limit=None))
             
         except Exception as e:
-            job.status = ProcessingStatus.FAILED
-            job.error_message = str(e)
-            logger.error(f"Extraction error: {e}")
+            self._fail_extraction(job, e)
         
         return job
     
+    async def execute_extractions_async(self, jobs: List[ExtractionJob]) -> List[ExtractionJob]:
+        """Run several extraction jobs concurrently on one event loop"""
+        return list(await asyncio.gather(*(self.execute_extraction_async(job) for job in jobs)))
+    
+    def execute_extractions(self, jobs: List[ExtractionJob]) -> List[ExtractionJob]:
+        """Run several extraction jobs concurrently and wait for all of them"""
+        return asyncio.run(self.execute_extractions_async(jobs))
+    
+    def _prepare_extraction(self, job: ExtractionJob) -> List[str]:
+        """Create the output directory and build the Docker command for a job"""
+        # Ensure output directory exists
+        job.output_path.mkdir(parents=True, exist_ok=True)
+        
+        # Build Docker command
+        docker_cmd = [
+            "docker", "run", "--rm",
+            "-v", f"{job.source_path.parent.absolute()}:/data:ro",
+            "--mount", f"type=bind,src={job.output_path.absolute()},dst=/output",
+            "-e", f"TIMESTAMP={job.coordinate.timestamp}",
+            self.docker_image
+        ]
+        
+        logger.info(f"Running extraction for {job.coordinate.timestamp}")
+        logger.debug(f"Docker command: {' '.join(docker_cmd)}")
+        
+        return docker_cmd
+    
+    def _finish_extraction(self, job: ExtractionJob, docker_cmd: List[str],
+                           returncode: int, stdout: str, stderr: str):
+        """Record the outcome of a finished extraction container"""
+        if returncode != 0:
+            raise subprocess.CalledProcessError(
+                returncode, docker_cmd, output=stdout, stderr=stderr
+            )
+        
+        job.docker_output = stdout
+        job.status = ProcessingStatus.COMPLETE
+        job.completed_at = datetime.now()
+        
+        # Post-processing below is best effort; the container already succeeded
+        
+        # Count extracted items
+        try:
+            self._update_extraction_stats(job)
+        except Exception:
+            logger.exception(f"Failed to update extraction stats for {job.coordinate.timestamp}")
+        
+        # Store columnar copies for faster repeat loads
+        try:
+            self._write_parquet_sidecars(job)
+        except Exception:
+            logger.exception(f"Failed to write Parquet sidecars for {job.coordinate.timestamp}")
+        
+        logger.info(f"Extraction completed for {job.coordinate.timestamp}")
+    
+    def _fail_extraction(self, job: ExtractionJob, error: Exception):
+        """Mark a job as failed"""
+        job.status = ProcessingStatus.FAILED
+        job.error_message = str(error)
+        
+        if isinstance(error, subprocess.CalledProcessError):
+            job.docker_output = error.stderr if error.stderr else error.stdout
+            logger.error(f"Extraction failed: {error}")
+        else:
+            logger.error(f"Extraction error: {error}")
+    
+    def _run_in_worker(self, job: ExtractionJob) -> Optional[Dict]:
+        """
+        Run a job in the long-lived worker container.
+        The worker handles one job at a time; concurrent callers get None
+        and run in their own one-off container instead of queueing.
+        
+        Args:
+            job: Extraction job to run
+            
+        Returns:
+            Worker reply, or None if the job must run in a one-off container
+            
+        Raises:
+            RuntimeError: If the job exceeds worker_timeout
+        """
+        if self._worker_disabled:
+            return None
+        
+        try:
+            src = job.source_path.absolute().relative_to(self.raw_root)
+            dst = job.output_path.absolute().relative_to(self.processed_root)
+        except ValueError:
+            # Job paths are outside the worker's mounts
+            return None
+        
+        request = json.dumps({'src': src.as_posix(), 'dst': dst.as_posix()})
+        
+        if not self._worker_lock.acquire(blocking=False):
+            return None
+        
+        try:
+            try:
+                worker = self._ensure_worker()
+                worker.stdin.write(request + "\n")
+                worker.stdin.flush()
+                
+                # Wait for the reply off-thread so a hung worker can't block forever
+                line = self._worker_reader.submit(worker.stdout.readline).result(
+                    timeout=self.worker_timeout
+                )
+                if not line:
+                    raise RuntimeError("worker exited without replying")
+                reply = json.loads(line)
+            except FutureTimeoutError:
+                # A rerun in a one-off container would repeat the same work, so
+                # fail the job; the worker restarts on the next job
+                self._kill_worker()
+                raise RuntimeError(
+                    f"Extraction did not finish within {self.worker_timeout}s"
+                ) from None
+            except Exception as e:
+                # Worker could not start or broke the protocol
+                logger.warning(f"Extraction worker unavailable, using one-off containers: {e}")
+                self._worker_disabled = True
+                self._stop_worker()
+                return None
+            
+            reply['cmd'] = worker.args
+            return reply
+        finally:
+            self._worker_lock.release()
+    
+    def _ensure_worker(self) -> subprocess.Popen:
+        """Start the worker container if it is not running"""
+        if self._worker is not None and self._worker.poll() is None:
+            return self._worker
+        
+        docker_cmd = [
+            "docker", "run", "-i", "--rm",
+            "--name", self._worker_name,
+            "-v", f"{self.raw_root}:/data:ro",
+            "--mount", f"type=bind,src={self.processed_root},dst=/output",
+            self.docker_image,
+            "python3", "-u", "/app/worker.py"
+        ]
+        
+        logger.info(f"Starting extraction worker {self._worker_name}")
+        logger.debug(f"Docker command: {' '.join(docker_cmd)}")
+        
+        self._worker = subprocess.Popen(
+            docker_cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1
+        )
+        return self._worker
+    
+    def _stop_worker(self):
+        """Stop the worker container; closing stdin ends its job loop"""
+        worker, self._worker = self._worker, None
+        if worker is None:
+            return
+        
+        try:
+            worker.stdin.close()
+            worker.wait(timeout=10)
+        except Exception:
+            self._kill_worker(worker)
+    
+    def _kill_worker(self, worker: Optional[subprocess.Popen] = None):
+        """
+        Kill the worker container and its docker client.
+        Killing only the client would leave the container running.
+        """
+        worker = worker or self._worker
+        if worker is None:
+            return
+        
+        subprocess.run(
+            ["docker", "kill", self._worker_name],
+            capture_output=True,
+            check=False
+        )
+        worker.kill()
+        worker.wait()
+    
+    def close(self):
+        """Release the worker container, interrupting any job it is running"""
+        self._stop_worker()
+        self._worker_reader.shutdown(wait=False)
+    
+    def __del__(self):
+        try:
+            self._stop_worker()
+        except Exception:
+            pass
+    
     def _update_extraction_stats(self, job: ExtractionJob):
-        """Update extraction statistics from output files"""
+        """
+        Update extraction statistics from output files.
+        Processed bags are counted on demand by get_bags_processed.
+        """
         try:
-            # Count frames
-            frames_csv = job.output_path / "frames.csv"
-            if frames_csv.exists():
-                df = pd.read_csv(frames_csv)
-                job.frames_extracted = len(df)
-            
-            # Count detections
-            detections_csv = job.output_path / "detections.csv"
-            if detections_csv.exists():
-                df = pd.read_csv(detections_csv)
-                job.detections_extracted = df['num_detections'].sum() if 'num_detections' in df.columns else len(df)
-            
-            # Count processed bags
-            metadata_yaml = job.output_path / "metadata.yaml"
-            if metadata_yaml.exists():
-                with open(metadata_yaml, 'r') as f:
-                    metadata = yaml.safe_load(f)
-                    if metadata and 'bags' in metadata:
-                        job.bags_processed = len(metadata['bags'])
+            # List output files once instead of probing each one
+            names = {entry.name for entry in os.scandir(job.output_path)}
+            
+            if "frames.csv" in names:
+                job.frames_extracted = self._count_frames(job.output_path)
+            
+            if "detections.csv" in names:
+                job.detections_extracted = self._count_detections(job.output_path)
                         
-        except Exception as e:
-            logger.warning(f"Failed to update extraction stats: {e}")
\ No newline at end of file
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to update extraction stats: {e}")
+    
+    def _count_frames(self, output_path: Path) -> int:
+        """Count extracted frames"""
+        return _count_csv_rows(output_path / "frames.csv")
+    
+    def _count_detections(self, output_path: Path) -> int:
+        """Count extracted detections"""
+        import pandas as pd
+        
+        df = pd.read_csv(output_path / "detections.csv")
+        return df['num_detections'].sum() if 'num_detections' in df.columns else len(df)
+    
+    def get_bags_processed(self, job: ExtractionJob) -> int:
+        """
+        Get the number of bags a job processed, reading metadata.yaml on first need
+        
+        Args:
+            job: Extraction job
+            
+        Returns:
+            Number of processed bags (0 if not complete or unreadable)
+        """
+        if job.bags_processed is not None:
+            return job.bags_processed
+        
+        if job.status != ProcessingStatus.COMPLETE:
+            return 0
+        
+        # Only a successful read is stored, so a failure is retried next time
+        try:
+            job.bags_processed = self._count_bags(job.output_path)
+        except (OSError, ValueError, yaml.YAMLError) as e:
+            logger.warning(f"Failed to read processed bags: {e}")
+            return 0
+        
+        return job.bags_processed
+    
+    def _count_bags(self, output_path: Path) -> int:
+        """Count processed bags listed in metadata.yaml"""
+        with open(output_path / "metadata.yaml", 'r') as f:
+            metadata = yaml.load(f, Loader=YAML_LOADER)
+        bags = (metadata or {}).get('bags')
+        return len(bags) if isinstance(bags, list) else 0
+    
+    def _write_parquet_sidecars(self, job: ExtractionJob):
+        """Write a Parquet copy next to each extracted CSV"""
+        import pandas as pd
+        
+        for name in ("frames", "detections", "tracking"):
+            csv_path = job.output_path / f"{name}.csv"
+            parquet_path = csv_path.with_suffix(".parquet")
+            
+            try:
+                # Never leave a sidecar from an earlier extraction next to a new CSV
+                parquet_path.unlink(missing_ok=True)
+                if not csv_path.exists():
+                    continue
+                
+                df = pd.read_csv(csv_path)
+                df.to_parquet(parquet_path, compression="zstd")
+            except Exception as e:
+                logger.warning(f"Failed to write Parquet for {csv_path.name}: {e}")
@@ -7,13 +7,20 @@ Pure service layer with no UI dependencies
 import logging
 import re
 import json
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Callable
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from google.cloud import storage
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # Timestamp regex pattern
@@ -38,6 +45,9 @@ class GCSService:
         self._discovered_data = {}
         self._cache_info = {}
         
+        # mtime of the cache file that _discovered_data was loaded from or saved to
+        self._cache_mtime_ns: Optional[int] = None
+        
         # Ensure cache directory exists
         self.cache_file.parent.mkdir(parents=True, exist_ok=True)
         
@@ -121,6 +131,7 @@ class GCSService:
         """Clear cached data and remove cache file"""
         self._discovered_data = {}
         self._cache_info = {}
+        self._cache_mtime_ns = None
         
         if self.cache_file.exists():
             self.cache_file.unlink()
@@ -132,19 +143,33 @@ class GCSService:
         """Perform fresh discovery of both buckets"""
         
         if progress_callback:
-            progress_callback("Discovering raw bucket...")
-        logger.info("Discovering raw bucket...")
-        self._discovered_data['raw'] = self._discover_raw_bucket()
+            progress_callback("Discovering raw and ML buckets...")
+        logger.info("Discovering raw and ML buckets...")
         
-        if progress_callback:
-            progress_callback("Discovering ML bucket...")
-        logger.info("Discovering ML bucket...")
-        self._discovered_data['ml'] = self._discover_ml_bucket()
+        # Bucket listings are independent network-bound walks, run them side by side
+        discoveries = {
+            'raw': self._discover_raw_bucket,
+            'ml': self._discover_ml_bucket
+        }
+        with ThreadPoolExecutor(max_workers=len(discoveries)) as executor:
+            futures = {
+                bucket_type: executor.submit(self._timed_discovery, bucket_type, discover)
+                for bucket_type, discover in discoveries.items()
+            }
+            for bucket_type, future in futures.items():
+                self._discovered_data[bucket_type] = future.result()
         
         if progress_callback:
             progress_callback("Discovery complete")
         logger.info("Bucket discovery completed")
     
+    def _timed_discovery(self, bucket_type: str, discover: Callable[[], Dict]) -> Dict:
+        """Run a bucket discovery and log how long it took"""
+        start = time.perf_counter()
+        result = discover()
+        logger.info(f"Discovered {bucket_type} bucket in {time.perf_counter() - start:.1f}s")
+        return result
+    
     def _discover_raw_bucket(self) -> Dict:
         """Discover raw bucket: count .bag files per timestamp"""
         bucket = self.buckets['raw']
@@ -265,11 +290,20 @@ class GCSService:
     def _load_from_cache(self) -> bool:
         """Load discovered data from cache file"""
         try:
-            if not self.cache_file.exists():
+            try:
+                mtime_ns = self.cache_file.stat().st_mtime_ns
+            except FileNotFoundError:
                 return False
             
-            with open(self.cache_file, 'r') as f:
-                cache_data = json.load(f)
+            # Skip re-parsing when the file hasn't changed since we last read or wrote it
+            if self._discovered_data and mtime_ns == self._cache_mtime_ns:
+                return True
+            
+            if orjson is not None:
+                cache_data = orjson.loads(self.cache_file.read_bytes())
+            else:
+                with open(self.cache_file, 'r') as f:
+                    cache_data = json.load(f)
             
             # Validate cache structure
             required_keys = ['discovered_data', 'cache_info', 'bucket_names']
@@ -283,6 +317,7 @@ class GCSService:
             
             self._discovered_data = cache_data['discovered_data']
             self._cache_info = cache_data['cache_info']
+            self._cache_mtime_ns = mtime_ns
             return True
             
         except Exception as e:
@@ -306,6 +341,7 @@ class GCSService:
                 json.dump(cache_data, f, indent=2)
             
             self._cache_info = cache_data['cache_info']
+            self._cache_mtime_ns = self.cache_file.stat().st_mtime_ns
             logger.info(f"Cache saved to {self.cache_file}")
             
         except Exception as e:
@@ -0,0 +1,48 @@
+"""
+Shared helpers for services that inspect local run directories
+"""
+import os
+import yaml
+from pathlib import Path
+from typing import Callable, List, Tuple, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from models.data_models import RunCoordinate
+
+T = TypeVar('T')
+
+# How long a missing run directory is trusted before checking disk again
+NEGATIVE_CACHE_TTL_S = 5.0
+
+# Batch status checks below this size run sequentially
+PARALLEL_STATUS_THRESHOLD = 4
+
+# Prefer the LibYAML C loader when PyYAML was built against it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@lru_cache(maxsize=16384)
+def coord_path(root: Path, path_tuple: Tuple[str, ...]) -> Path:
+    """Directory for a coordinate under root, built once per coordinate"""
+    return root.joinpath(*path_tuple)
+
+
+def map_status(fn: Callable[[RunCoordinate], T], coords: List[RunCoordinate]) -> List[T]:
+    """
+    Apply a per-run status check to many runs, overlapping filesystem latency
+
+    Args:
+        fn: Status check for a single run
+        coords: Run coordinates
+
+    Returns:
+        Results in the same order as coords
+    """
+    # Thread start-up isn't worth it for a handful of runs
+    if len(coords) <= PARALLEL_STATUS_THRESHOLD:
+        return [fn(coord) for coord in coords]
+
+    max_workers = min(32, len(coords), (os.cpu_count() or 4) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(fn, coords))
@@ -2,20 +2,52 @@
 Service for rosbag data operations
 Handles loading and managing extracted rosbag data
 """
+import os
 import json
 import yaml
+import time
 import logging
+from stat import S_ISDIR
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Any, Callable, Dict, Optional, List
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from models.data_models import (
     RunCoordinate, ExtractedData, DataStatus
 )
+from services.local_fs import NEGATIVE_CACHE_TTL_S, YAML_LOADER, coord_path, map_status
 
 logger = logging.getLogger(__name__)
 
+# Expected extraction outputs, by file name -> status key
+EXTRACTION_FILES = {
+    'frames.csv': 'frames',
+    'detections.csv': 'detections',
+    'tracking.csv': 'tracking',
+    'metadata.yaml': 'metadata'
+}
+
+
+def _load_json(path: Path):
+    """Parse a JSON file, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _load_yaml(path: Path):
+    """Parse a YAML file with the fastest available safe loader"""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=YAML_LOADER)
+
 
 class RosbagService:
     """
@@ -33,6 +65,12 @@ class RosbagService:
         """
         self.raw_root = Path(raw_root)
         self.processed_root = Path(processed_root)
+        
+        # Extraction status per coordinate, validated by processed dir mtime
+        self._status_cache: Dict[str, tuple] = {}
+        
+        # Coordinates recently found without a processed dir -> expiry (monotonic)
+        self._negative_cache: Dict[str, float] = {}
     
     def check_extraction_status(self, coord: RunCoordinate) -> Dict:
         """
@@ -45,26 +83,47 @@ class RosbagService:
             Dictionary with status and file information
         """
         processed_path = self._get_processed_path(coord)
+        key = coord.to_path_str()
         
-        if not processed_path.exists():
+        # Recently confirmed missing, skip the stat
+        expiry = self._negative_cache.get(key)
+        if expiry is not None and expiry > time.monotonic():
             return {
                 'status': DataStatus.NOT_DOWNLOADED,
                 'path': None,
                 'files': {}
             }
         
-        # Check for expected output files
-        frames_csv = processed_path / "frames.csv"
-        detections_csv = processed_path / "detections.csv"
-        tracking_csv = processed_path / "tracking.csv"
-        metadata_yaml = processed_path / "metadata.yaml"
-        
-        files = {
-            'frames': frames_csv.exists(),
-            'detections': detections_csv.exists(),
-            'tracking': tracking_csv.exists(),
-            'metadata': metadata_yaml.exists()
-        }
+        # One stat answers both "does it exist" and "is it a directory"
+        try:
+            st = os.stat(processed_path)
+        except (FileNotFoundError, NotADirectoryError):
+            st = None
+        
+        if st is None or not S_ISDIR(st.st_mode):
+            self._negative_cache[key] = time.monotonic() + NEGATIVE_CACHE_TTL_S
+            return {
+                'status': DataStatus.NOT_DOWNLOADED,
+                'path': None,
+                'files': {}
+            }
+        mtime = st.st_mtime_ns
+        
+        # Reuse the previous result while the directory is unchanged
+        cached = self._status_cache.get(key)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        # Check for expected output files with a single directory read
+        files = dict.fromkeys(EXTRACTION_FILES.values(), False)
+        try:
+            with os.scandir(processed_path) as entries:
+                for entry in entries:
+                    status_key = EXTRACTION_FILES.get(entry.name)
+                    if status_key is not None:
+                        files[status_key] = True
+        except (FileNotFoundError, NotADirectoryError):
+            pass
         
         # Determine overall status
         if all(files.values()):
@@ -74,11 +133,32 @@ class RosbagService:
         else:
             status = DataStatus.DOWNLOADED  # No extraction yet
         
-        return {
+        result = {
             'status': status,
             'path': str(processed_path),
             'files': files
         }
+        self._status_cache[key] = (mtime, result)
+        
+        return result
+    
+    def check_extraction_status_many(self, coords: List[RunCoordinate]) -> List[Dict]:
+        """
+        Check extraction status for many runs, overlapping filesystem latency
+        
+        Args:
+            coords: Run coordinates
+            
+        Returns:
+            Status dictionaries in the same order as coords
+        """
+        return map_status(self.check_extraction_status, coords)
+    
+    def invalidate_status(self, coord: RunCoordinate):
+        """Drop the cached extraction status for a run"""
+        key = coord.to_path_str()
+        self._status_cache.pop(key, None)
+        self._negative_cache.pop(key, None)
     
     def load_extracted_data(self, coord: RunCoordinate) -> Optional[ExtractedData]:
         """
@@ -92,51 +172,79 @@ class RosbagService:
         """
         processed_path = self._get_processed_path(coord)
         
-        if not processed_path.exists():
+        if not os.path.isdir(processed_path):
             logger.warning(f"No processed data found at {processed_path}")
             return None
         
         data = ExtractedData()
         
-        # Load CSVs
-        frames_csv = processed_path / "frames.csv"
-        if frames_csv.exists():
-            data.frames_df = pd.read_csv(frames_csv)
-            logger.debug(f"Loaded {len(data.frames_df)} frames")
+        # Files are independent, so read and parse them concurrently
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            frames = executor.submit(self._load_table, processed_path, "frames")
+            detections = executor.submit(self._load_table, processed_path, "detections")
+            tracking = executor.submit(self._load_table, processed_path, "tracking")
+            detections_json = executor.submit(self._load_optional, processed_path / "detections_full.json", _load_json)
+            tracking_json = executor.submit(self._load_optional, processed_path / "tracking_full.json", _load_json)
+            metadata = executor.submit(self._load_optional, processed_path / "metadata.yaml", _load_yaml)
+            
+            data.frames_df = frames.result()
+            data.detections_df = detections.result()
+            data.tracking_df = tracking.result()
+            data.detections_json = detections_json.result()
+            data.tracking_json = tracking_json.result()
+            data.metadata = metadata.result()
         
-        detections_csv = processed_path / "detections.csv"
-        if detections_csv.exists():
-            data.detections_df = pd.read_csv(detections_csv)
+        if data.frames_df is not None:
+            logger.debug(f"Loaded {len(data.frames_df)} frames")
+        if data.detections_df is not None:
             logger.debug(f"Loaded {len(data.detections_df)} detection messages")
-        
-        tracking_csv = processed_path / "tracking.csv"
-        if tracking_csv.exists():
-            data.tracking_df = pd.read_csv(tracking_csv)
+        if data.tracking_df is not None:
             logger.debug(f"Loaded {len(data.tracking_df)} tracking messages")
         
-        # Load JSON files
-        detections_json = processed_path / "detections_full.json"
-        if detections_json.exists():
-            with open(detections_json, 'r') as f:
-                data.detections_json = json.load(f)
-        
-        tracking_json = processed_path / "tracking_full.json"
-        if tracking_json.exists():
-            with open(tracking_json, 'r') as f:
-                data.tracking_json = json.load(f)
-        
-        # Load metadata
-        metadata_yaml = processed_path / "metadata.yaml"
-        if metadata_yaml.exists():
-            with open(metadata_yaml, 'r') as f:
-                data.metadata = yaml.safe_load(f)
-                if data.metadata:
-                    data.source_bags = [bag['name'] for bag in data.metadata.get('bags', [])]
+        if data.metadata:
+            data.source_bags = [bag['name'] for bag in data.metadata.get('bags', [])]
         
         data.extraction_time = datetime.now()
         
         return data
     
+    def _load_optional(self, path: Path, loader: Callable[[Path], Any]) -> Any:
+        """Load a file with the given loader, or return None if it doesn't exist"""
+        if not path.exists():
+            return None
+        return loader(path)
+    
+    def _load_table(self, processed_path: Path, name: str) -> Optional[pd.DataFrame]:
+        """
+        Load an extracted table, using the Parquet copy when it is up to date
+        
+        Args:
+            processed_path: Processed data directory for the run
+            name: Table name without extension (e.g. "frames")
+            
+        Returns:
+            DataFrame or None if the table was not extracted
+        """
+        parquet_path = processed_path / f"{name}.parquet"
+        csv_path = processed_path / f"{name}.csv"
+        
+        # A sidecar older than its CSV is left over from a previous extraction
+        try:
+            use_parquet = os.stat(parquet_path).st_mtime_ns >= os.stat(csv_path).st_mtime_ns
+        except FileNotFoundError:
+            use_parquet = parquet_path.exists()
+        
+        if use_parquet:
+            try:
+                return pd.read_parquet(parquet_path)
+            except Exception as e:
+                logger.warning(f"Failed to read {parquet_path.name}, falling back to CSV: {e}")
+        
+        if csv_path.exists():
+            return pd.read_csv(csv_path)
+        
+        return None
+    
     def get_available_bags(self, coord: RunCoordinate) -> List[str]:
         """
         Get list of available bag files for a run
@@ -149,16 +257,16 @@ class RosbagService:
         """
         raw_path = self._get_raw_path(coord)
         
-        if not raw_path.exists():
+        try:
+            with os.scandir(raw_path) as entries:
+                return sorted(entry.name for entry in entries if entry.name.endswith(".bag"))
+        except (FileNotFoundError, NotADirectoryError):
             return []
-        
-        bags = sorted(raw_path.glob("*.bag"))
-        return [bag.name for bag in bags]
     
     def _get_raw_path(self, coord: RunCoordinate) -> Path:
         """Get raw data path for coordinate"""
-        return self.raw_root / coord.to_path_str()
+        return coord_path(self.raw_root, coord.to_path_tuple())
     
     def _get_processed_path(self, coord: RunCoordinate) -> Path:
         """Get processed data path for coordinate"""
-        return self.processed_root / coord.to_path_str()
\ No newline at end of file
+        return coord_path(self.processed_root, coord.to_path_tuple())
\ No newline at end of file